@@ -1,13 +1,33 @@
-from typing import Generator
 from time import time
+from decimal import Decimal
+
+
+def _scanMinimalError(L:int, a:int, b:int, n:int) -> int:
+    # plain scalar loop without attribute lookups or containers, O(1) memory
+    # strength reduced: error(x+1) = (error(x) - a) mod b, exact in integers so no drift
+    step = a % b
+    error = L % b
+    min_error = b
+    min_x = 0
+    for x in range(n):
+        if error < min_error:
+            min_error = error
+            min_x = x
+        error -= step
+        if error < 0:
+            error += b
+    return min_x
+
 
 class Linfit:
     """
     A class designed to minimize the residual error in a linear equation of the form `L = a*x + b*y`
     by finding integer values for `x` and `y` that yield the closest approximation to `L`.
 
-    The goal is to minimize the residual error `L - (a*x + b*y)` by iterating over a valid range
-    of integer `x` values and calculating the corresponding integer `y` values.
+    The goal is to minimize the residual error `L - (a*x + b*y)`. After rationalizing `L`, `a` and `b`
+    to integers, the minimal residual and its `x` value follow in closed form from the extended
+    Euclidean algorithm. Only if that solution lies outside the valid range of integer `x` values,
+    the (then short) range is iterated and the corresponding integer `y` values are calculated.
 
     The class implements an optimization technique that reduces the residual by switching the
     coefficients `a` and `b` if necessary, ensuring that the larger coefficient is always associated
@@ -21,33 +41,46 @@ class Linfit:
         The coefficient for the variable `x` in the equation. Automatically adjusted if `b > a`.
     _b : float
         The coefficient for the variable `y` in the equation. Automatically adjusted if `b > a`.
+    _places : int
+        The number of decimal places needed to represent both `a` and `b` exactly.
+    _A, _B : int
+        The coefficients `a` and `b` scaled by `10**_places` to integers.
+    _L_int, _A_int, _B_int : int
+        `L`, `a` and `b` scaled by a common power of ten to integers, set by `solve`.
 
     Methods:
     --------
     _reduceResidualsInVarSwitching(a: float, b: float) -> None:
         Adjusts coefficients `a` and `b` to ensure that the larger coefficient is used for `x`.
 
+    _decimalPlaces(value: float) -> int:
+        Returns the number of decimal places of the shortest representation of `value`.
+
+    _scaleCoefficients() -> None:
+        Scales `a` and `b` once per instance to the integers `_A` and `_B`.
+
+    _scaleToIntegers() -> None:
+        Scales `L`, `a` and `b` by a common power of ten to the integers `_L_int`, `_A_int` and `_B_int`.
+
+    _extendedEuclid(a: int, b: int) -> tuple:
+        Returns `(g, u, v)` with `g = gcd(a, b)` and the Bezout coefficients `a*u + b*v = g`.
+
+    _closedFormSolution() -> tuple | None:
+        Computes the smallest `x` and its `y` attaining the minimal residual `_L_int mod g`, or `None`
+        if that `x` exceeds the valid range.
+
     _getValidXRange() -> range:
         Computes the valid range of integer `x` values based on the given target `L` and coefficient `a`.
 
-    _y(x: float) -> float:
-        Computes the corresponding `y` value for a given `x` in the equation.
-
-    _max_y_int(y: float) -> int:
-        Returns the largest integer less than or equal to the computed `y` value.
+    _max_y_int(x: int) -> int:
+        Returns the largest integer `y` with `a*x + b*y <= L` for a given integer `x`.
 
     _errorPlane(x: float | int, y: float | int) -> float:
         Calculates the residual error `L - (a*x + b*y)` for given values of `x` and `y`.
 
-    _getError(x_int: float) -> float:
-        Computes the residual error for a given integer `x` and its corresponding integer `y`.
-
-    _minimalErrorGenerator(x_range: range) -> Generator:
-        Iterates over the range of `x` values and generates tuples of the minimum residual error
-        and the corresponding `x` value.
-
-    _undercutMinError(error_generator: Generator) -> int:
-        Extracts the `x` value that yields the minimum residual error from the error generator.
+    _minimalErrorX(x_range: range) -> int:
+        Sweeps the range of `x` values in a single module-level loop and returns the first `x` that
+        yields the minimum residual error `(_L_int - _A_int*x) mod _B_int`.
 
     _printResult(x_sol: int, y_sol: int, len_resi: int, len_time: str) -> None:
         Prints the optimized solution, showing the integer values `x_sol` and `y_sol` and their
@@ -92,6 +125,7 @@ class Linfit:
         be swapped internally so that `a = 1.25` and `b = 0.80`.
         """
         self._reduceResidualsInVarSwitching(a, b)
+        self._scaleCoefficients()
 
     
     def _reduceResidualsInVarSwitching(self, a:float, b:float) -> None:
@@ -101,49 +135,61 @@ class Linfit:
             self._a, self._b = a, b
 
 
-    def _getValidXRange(self) -> range:
-        return range(int(self._L / self._a)+1) # +1 -> range omits last int
-    
+    def _decimalPlaces(self, value:float) -> int:
+        return max(0, -Decimal(repr(value)).as_tuple().exponent)
 
-    def _y(self, x:float) -> float:
-        return (self._L - self._a * x) / self._b
 
-    def _max_y_int(self, y:float) -> int:
-        return int(y - y%1)
-    
-    def _errorPlane(self, x:float|int, y:float|int) -> float:
-        return self._L - self._a*x - self._b*y
+    def _scaleCoefficients(self) -> None:
+        self._places = max(self._decimalPlaces(self._a), self._decimalPlaces(self._b))
+        self._A = int(Decimal(repr(self._a)).scaleb(self._places))
+        self._B = int(Decimal(repr(self._b)).scaleb(self._places))
 
 
-    def _getError(self, x_int:float) -> float:
-        y_int = self._max_y_int(self._y(x_int))
-        error = self._errorPlane(x_int, y_int)
-        return error
+    def _scaleToIntegers(self) -> None:
+        shift = max(0, self._decimalPlaces(self._L) - self._places) # extra places only L needs
+        self._L_int = int(Decimal(repr(self._L)).scaleb(self._places + shift))
+        self._A_int = self._A * 10**shift
+        self._B_int = self._B * 10**shift
 
 
-    def _minimalErrorGenerator(self, x_range:range) -> Generator:
-        min_error = float('inf')
-        min_x = None
-        for x in x_range:
-            error = self._getError(x)
-            if error < min_error:
-                min_error = error
-                min_x = x
-                yield min_error, min_x
+    def _extendedEuclid(self, a:int, b:int) -> tuple:
+        old_r, r = a, b
+        old_u, u = 1, 0
+        old_v, v = 0, 1
+        while r:
+            q = old_r // r
+            old_r, r = r, old_r - q*r
+            old_u, u = u, old_u - q*u
+            old_v, v = v, old_v - q*v
+        return old_r, old_u, old_v
 
 
-    def _undercutMinError(self, error_generator: Generator) -> int:
-        min_error = float('inf')
-        best_x_values = []
+    def _closedFormSolution(self) -> tuple|None:
+        L_int, A, B = self._L_int, self._A_int, self._B_int
+        g, u, _ = self._extendedEuclid(A, B)
+        min_rest = L_int % g # every reachable residual is congruent to L_int modulo g
+        period = B // g # x-shift of the homogeneous solution (x + B/g, y - A/g)
+        x = u * ((L_int - min_rest) // g) % period
+        y = self._max_y_int(x)
+        if y < 0:
+            return None # smallest x with minimal residual lies beyond L/a
+        return x, y
 
-        for error, x in error_generator:
-            if error < min_error:
-                min_error = error
-                best_x_values = [x]
-            elif error == min_error:
-                best_x_values.append(x)
-        
-        return max(best_x_values)
+
+    def _getValidXRange(self) -> range:
+        return range(self._L_int // self._A_int + 1) # +1 -> range omits last int
+    
+
+    def _max_y_int(self, x:int) -> int:
+        return (self._L_int - self._A_int * x) // self._B_int
+    
+    def _errorPlane(self, x:float|int, y:float|int) -> float:
+        return self._L - self._a*x - self._b*y
+
+
+    def _minimalErrorX(self, x_range:range) -> int:
+        # L - a*x - b*floor((L - a*x)/b) fused into one modulo, the first minimal x is kept
+        return _scanMinimalError(self._L_int, self._A_int, self._B_int, len(x_range))
 
 
     def _printResult(self, x_sol:int, y_sol:int, len_resi:int, len_time:str) -> None:
@@ -182,8 +228,10 @@ class Linfit:
         Executes the minimization process to find integer values `x` and `y` that minimize the residual error 
         in the equation `E = L - a*x - b*y`.
 
-        The method calculates the valid range of `x` values based on the coefficient `a`, computes the 
-        corresponding `y` values for each `x`, and identifies the solution with the minimal residual error.
+        The method scales `L`, `a` and `b` to integers and solves the linear Diophantine equation in closed form
+        with the extended Euclidean algorithm. Only if the smallest optimal `x` exceeds the valid range
+        `[0, L/a]`, the corresponding `y` values are computed for each `x` in that range and the solution
+        with the minimal residual error is identified.
         It also prints the optimized result and displays information about the process, including the number
         of residuals evaluated and the time taken for optimization.
 
@@ -215,13 +263,17 @@ class Linfit:
         - The time taken for the optimization.
         """
         self._L = L
+        self._scaleToIntegers()
 
         x_range = self._getValidXRange()
-        error_generator = self._minimalErrorGenerator(x_range)
         
         start_time = time()
-        x_sol = self._undercutMinError(error_generator)
-        y_sol = self._max_y_int(self._y(x_sol))
+        solution = self._closedFormSolution()
+        if solution is None:
+            x_sol = self._minimalErrorX(x_range)
+            y_sol = self._max_y_int(x_sol)
+        else:
+            x_sol, y_sol = solution
         end_time = time()
 
         len_time = end_time - start_time